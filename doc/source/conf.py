@@ -3,14 +3,21 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
+import glob
 import os
 import shutil
 import subprocess
 
 import yaml
 
+import wettingfront
 from wettingfront import get_sample_path
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
 os.environ["WETTINGFRONT_SAMPLES"] = get_sample_path()
 
 # -- Project information -----------------------------------------------------
@@ -76,38 +83,55 @@ plot_html_show_source_link = False
 
 # Tutorial files
 
-with open("example.yml", "r") as f:
-    data = yaml.load(f, Loader=yaml.FullLoader)
-
-subprocess.call(
-    [
-        "wettingfront",
-        "analyze",
-        "example.yml",
-    ],
+PACKAGE_SOURCES = glob.glob(
+    os.path.join(os.path.dirname(wettingfront.__file__), "**", "*.py"),
+    recursive=True,
 )
 
-os.makedirs("_static", exist_ok=True)
-shutil.copy("output/example1.mp4", "_static/example1.mp4")
 
-# Reference file
+def outdated(target, *sources):
+    """Check if *target* does not exist or is older than any of *sources*."""
+    if not os.path.exists(target):
+        return True
+    return os.path.getmtime(target) < max(os.path.getmtime(s) for s in sources)
+
 
-f = open("help-wettingfront.txt", "w")
-subprocess.call(["wettingfront", "-h"], stdout=f)
-f.close()
+with open("example.yml", "r") as f:
+    data = yaml.load(f, Loader=YamlLoader)
 
-f = open("help-wettingfront-samples.txt", "w")
-subprocess.call(["wettingfront", "samples", "-h"], stdout=f)
-f.close()
+outputs = [
+    os.path.expandvars(v[field])
+    for v in data.values()
+    for field in ["output-vid", "output-data"]
+    if field in v
+]
+if any(outdated(out, "example.yml", *PACKAGE_SOURCES) for out in outputs):
+    subprocess.call(
+        [
+            "wettingfront",
+            "analyze",
+            "example.yml",
+        ],
+    )
 
-f = open("help-wettingfront-analyzers.txt", "w")
-subprocess.call(["wettingfront", "analyzers", "-h"], stdout=f)
-f.close()
+os.makedirs("_static", exist_ok=True)
+if outdated("_static/example1.mp4", "output/example1.mp4"):
+    shutil.copy("output/example1.mp4", "_static/example1.mp4")
 
-f = open("help-wettingfront-models.txt", "w")
-subprocess.call(["wettingfront", "models", "-h"], stdout=f)
-f.close()
+# Reference file
 
-f = open("help-wettingfront-analyze.txt", "w")
-subprocess.call(["wettingfront", "analyze", "-h"], stdout=f)
-f.close()
+HELP_COMMANDS = {
+    "help-wettingfront.txt": ["wettingfront", "-h"],
+    "help-wettingfront-samples.txt": ["wettingfront", "samples", "-h"],
+    "help-wettingfront-analyzers.txt": ["wettingfront", "analyzers", "-h"],
+    "help-wettingfront-models.txt": ["wettingfront", "models", "-h"],
+    "help-wettingfront-analyze.txt": ["wettingfront", "analyze", "-h"],
+}
+# Commands are independent, so run them concurrently.
+help_procs = []
+for fname, cmd in HELP_COMMANDS.items():
+    if outdated(fname, *PACKAGE_SOURCES):
+        with open(fname, "w") as f:
+            help_procs.append(subprocess.Popen(cmd, stdout=f))
+for proc in help_procs:
+    proc.wait()
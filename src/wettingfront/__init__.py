@@ -6,17 +6,13 @@ To analyze with command line, specify the parameters in configuration file(s) an
 """
 
 import argparse
-import csv
+import functools
 import glob
-import json
 import logging
 import os
 import re
 import sys
-from typing import List, Optional
-
-import numpy as np
-import yaml
+from typing import Any, Callable, Dict, List, Optional
 
 if sys.version_info < (3, 10):
     from importlib_metadata import entry_points
@@ -31,6 +27,15 @@ __all__ = [
 ]
 
 
+# Size in bytes above which YAML configuration files are reported as slow to parse.
+_LARGE_YAML_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=None)
+def _sample_root():
+    return files("wettingfront").joinpath("samples")
+
+
 def get_sample_path(*paths: str) -> str:
     """Get path to sample file.
 
@@ -47,7 +52,22 @@ def get_sample_path(*paths: str) -> str:
         >>> get_sample_path("myfile") # doctest: +SKIP
         'path/wettingfront/samples/myfile'
     """
-    return str(files("wettingfront").joinpath("samples", *paths))
+    return str(_sample_root().joinpath(*paths))
+
+
+@functools.lru_cache(maxsize=None)
+def _entry_points(group: str) -> Dict[str, Any]:
+    # Scanning the installed distributions is slow, so do it once per group.
+    return {ep.name: ep for ep in entry_points(group=group)}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_entry_point(group: str, name: str) -> Optional[Callable]:
+    # Plugins are imported on their first use only.
+    ep = _entry_points(group).get(name)
+    if ep is None:
+        return None
+    return ep.load()
 
 
 def analyze_files(
@@ -59,6 +79,10 @@ def analyze_files(
         * YAML
         * JSON
 
+    YAML files are parsed with the LibYAML binding of PyYAML if it is available,
+    falling back to the pure Python parser otherwise. JSON files are parsed with
+    :mod:`orjson` if it is installed (``fast`` optional dependency).
+
     Each file can have multiple entries. Each entry must have ``type`` field which
     specifies the analyzer. For example, the following YAML file contains ``foo``
     entry which is analyzed by ``Foo`` analyzer.
@@ -84,10 +108,18 @@ def analyze_files(
     Returns:
         Whether the analysis is finished without error.
     """
-    # load analyzers
-    ANALYZERS = {}
-    for ep in entry_points(group="wettingfront.analyzers"):
-        ANALYZERS[ep.name] = ep
+    # Parsers are imported here to keep the package import light.
+    import yaml
+
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads  # type: ignore[assignment]
+
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
 
     glob_paths = []
     for path in paths:
@@ -103,11 +135,17 @@ def analyze_files(
         _, ext = os.path.splitext(path)
         ext = ext.lstrip(os.path.extsep).lower()
         try:
-            with open(path, "r") as f:
+            with open(path, "rb") as f:
                 if ext == "yaml" or ext == "yml":
-                    data = yaml.load(f, Loader=yaml.FullLoader)
+                    if os.fstat(f.fileno()).st_size > _LARGE_YAML_SIZE:
+                        logging.warning(
+                            f"Parsing large YAML file: '{path}' "
+                            "(consider JSON for faster parsing)"
+                        )
+                    # Pass the stream to let the parser read it incrementally.
+                    data = yaml.load(f, Loader=YamlLoader)
                 elif ext == "json":
-                    data = json.load(f)
+                    data = json_loads(f.read())
                 else:
                     logging.error(f"Skipping file: '{path}' (format not supported)")
                     ok = False
@@ -116,14 +154,16 @@ def analyze_files(
             logging.error(f"Skipping file: '{path}' (does not exist)")
             ok = False
             continue
-        for k, v in data.items():
+        # Pop the entries so that each one is freed once it is analyzed.
+        for k in list(data):
+            v = data.pop(k)
             if entry_patterns and all([p.fullmatch(k) is None for p in entry_patterns]):
                 continue
             try:
                 typename = v["type"]
-                analyzer = ANALYZERS.get(typename, None)
+                analyzer = _load_entry_point("wettingfront.analyzers", typename)
                 if analyzer is not None:
-                    analyzer.load()(k, v)
+                    analyzer(k, v)
                 else:
                     logging.error(
                         f"Skipping entry: '{path}::{k}' (unknown type: '{typename}')"
@@ -135,109 +175,14 @@ def analyze_files(
     return ok
 
 
-def unidirect_analyzer(k, v):
-    """Image analysis for unidirectional liquid imbibition in porous medium.
-
-    .. note::
-
-        To evoke this analyzer, you need ``img`` optional dependency::
-
-            pip install wettingfront[img]
-
-    Unidirectional analyzer detects the horizontal wetting front in the image by
-    pixel intensities and fits the data to model.
-
-    The analyzer defines the following fields in configuration entry:
-
-    - **model** (`str`, optional): Wetting front model, implemented by plugins.
-    - **path** (`str`): Path to the input video file.
-    - **output-vid** (`str`, optional): Path to the output video file.
-    - **output-data** (`str`, optional): Path to the output csv file.
-
-    The output csv file contains three colums; time, wetting height, and fitted
-    wetting height. The time unit is seconds and the distance unit is pixels.
-
-    The following is the example for an entry in YAML configuration file:
-
-    .. code-block:: yaml
-
-        foo:
-            type: Unidirectional
-            model: Washburn
-            path: foo.mp4
-            output-vid: output/foo.mp4
-            output-data: output/foo.csv
-    """
-    import imageio.v3 as iio
-
-    MODELS = {}
-    for ep in entry_points(group="wettingfront.models"):
-        MODELS[ep.name] = ep
-
-    # Prepare output
-    model = v.get("model")
-    if model is not None:
-        model = MODELS[model].load()
-    path = os.path.expandvars(v["path"])
-    out_vid = v.get("output-vid")
-    out_data = v.get("output-data")
-    if out_vid:
-        out_vid = os.path.expandvars(v["output-vid"])
-        dirname, _ = os.path.split(out_vid)
-        if dirname:
-            os.makedirs(dirname, exist_ok=True)
-    if out_data:
-        out_data = os.path.expandvars(v["output-data"])
-        dirname, _ = os.path.split(out_data)
-        if dirname:
-            os.makedirs(dirname, exist_ok=True)
-
-    def yield_result(path):
-        for frame in iio.imiter(path, plugin="pyav"):
-            gray = np.dot(frame, [0.2989, 0.5870, 0.1140])
-            h = np.argmax(np.abs(np.diff(np.mean(gray, axis=1))))
-            frame[h, :] = (255, 0, 0)
-            yield frame, int(frame.shape[0] - h)
-
-    def iioWriter(path, codec, fps):
-        with iio.imopen(path, "w", plugin="pyav") as out:
-            out.init_video_stream(codec, fps=fps)
-            while True:
-                frame = yield
-                out.write_frame(frame)
-
-    immeta = iio.immeta(path, plugin="pyav")
-    gen = yield_result(path)
-
-    if out_vid:
-        iiowriter = iioWriter(out_vid, immeta["codec"], immeta["fps"])
-        next(iiowriter)
-    if out_data:
-        heights = []
-
-    for frame, h in gen:
-        if out_vid:
-            iiowriter.send(frame)
-        if out_data:
-            heights.append(h)
-
-    # write data
-    if out_data:
-        times = np.arange(len(heights)) / immeta["fps"]
-        if model is None:
-            header = ["time (s)", "height (pixels)"]
-            data = zip(times, heights)
-        else:
-            header = ["time (s)", "height (pixels)", "fitted height (pixels)"]
-            func, _ = model(times, heights)
-            predict = func(times)
-            data = zip(times, heights, predict)
+def __getattr__(name):
+    # Keep the analyzer importable from the package without importing NumPy
+    # when the package is imported.
+    if name == "unidirect_analyzer":
+        from .unidirect import unidirect_analyzer
 
-        with open(out_data, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(header)
-            for row in data:
-                writer.writerow(row)
+        return unidirect_analyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
@@ -326,8 +271,8 @@ def main():
         if args.list:
             header = [("PLUGIN", "PATH")]
             paths = [
-                (ep.name, ep.load()())
-                for ep in entry_points(group="wettingfront.samples")
+                (name, _load_entry_point("wettingfront.samples", name)())
+                for name in _entry_points("wettingfront.samples")
             ]
             col0_max = max(len(p[0]) for p in header + paths)
             space = 3
@@ -337,11 +282,9 @@ def main():
         elif args.plugin is None:
             print(get_sample_path())
         else:
-            for ep in entry_points(group="wettingfront.samples"):
-                if ep.name == args.plugin:
-                    getter = ep.load()
-                    print(getter())
-                    break
+            getter = _load_entry_point("wettingfront.samples", args.plugin)
+            if getter is not None:
+                print(getter())
             else:
                 logging.error(
                     f"Unknown plugin: '{args.plugin}' (use '-l' option to list plugins)"
@@ -351,7 +294,7 @@ def main():
         header = [("NAME", "SOURCE")]
         eps = [
             (ep.name, ep.value.split(":")[0])
-            for ep in entry_points(group=f"wettingfront.{args.command}")
+            for ep in _entry_points(f"wettingfront.{args.command}").values()
         ]
         col0_max = max(len(m[0]) for m in header + eps)
         space = 3
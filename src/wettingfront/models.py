@@ -1,9 +1,10 @@
 """Wetting front models."""
 
+from functools import partial
 from typing import Callable, Tuple
 
 import numpy as np
-from scipy.optimize import curve_fit, root  # type: ignore[import-untyped]
+from scipy.optimize import curve_fit  # type: ignore[import-untyped]
 
 __all__ = [
     "fit_washburn",
@@ -12,6 +13,66 @@ __all__ = [
 ]
 
 
+# Model functions are defined in module level so that the predictors returned by
+# the fitting functions can be pickled.
+
+
+def _washburn(t, k):
+    return k * np.sqrt(t)
+
+
+def _washburn_offset(t, k, a, b):
+    return k * np.sqrt(t - a) + b
+
+
+def _washburn_rideal(x, a, b):
+    positive = x > 0
+    x = np.where(positive, x, 1.0)  # avoid log(0)
+    return np.where(positive, a / 2 / b * x**2 - np.log(x) / a, 0.0)
+
+
+def _washburn_rideal_jac(x, a, b):
+    x = np.asarray(x)
+    jac = np.zeros(x.shape + (2,))
+    mask = x > 0
+    x = x[mask]
+    jac[mask, 0] = x**2 / 2 / b + np.log(x) / a**2
+    jac[mask, 1] = -a / 2 / b**2 * x**2
+    return jac
+
+
+def _washburn_rideal_residual(x, t, a, b):
+    # Residual of the equation and its derivative by x, sharing the intermediate
+    # arrays. Only valid for x > 0.
+    f = a / 2 / b * x**2 - np.log(x) / a - t
+    df = a / b * x - 1 / a / x
+    return f, df
+
+
+def _washburn_rideal_inverse(t, a, b, tol=1.48e-8, maxiter=50):
+    t = np.array(t, dtype=np.float64)
+    # Each equation depends on its own x only, so they are solved elementwise by
+    # vectorized Newton's method. The equation is convex in x with its minimum at
+    # sqrt(b)/a. Starting right of the minimum (not on it, where the derivative
+    # vanishes), the iterates stay on the increasing branch and converge to its
+    # root. The Washburn solution is used as the start where it is on that branch.
+    # Where t is below the minimum of the equation, no root exists; NaN is returned
+    # there and where the iteration does not converge.
+    x_min = np.sqrt(b) / a
+    x = np.maximum(_washburn(np.maximum(t, 0), np.sqrt(2 * b / a)), 2 * x_min)
+    converged = np.zeros(t.shape, dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(maxiter):
+            f, df = _washburn_rideal_residual(x, t, a, b)
+            dx = f / df
+            x = x - dx
+            converged = np.abs(dx) < tol
+            if np.all(converged):
+                break
+    t_min = _washburn_rideal(x_min, a, b)
+    return np.where(converged & (t >= t_min), x, np.nan)[()]
+
+
 def fit_washburn(t, x) -> Tuple[Callable, Tuple[np.float64]]:
     r"""Fit data to Washburn's equation [#f1]_.
 
@@ -36,12 +97,11 @@ def fit_washburn(t, x) -> Tuple[Callable, Tuple[np.float64]]:
     .. [#f1] Washburn, E. W. (1921). The dynamics of capillary flow.
              Physical review, 17(3), 273.
     """
-
-    def func(t, k):
-        return k * np.sqrt(t)
-
-    ret, _ = curve_fit(func, t, x)
-    return lambda t: func(t, *ret), ret
+    # The model is linear in k, so the least squares solution is closed-form.
+    sqrt_t = np.sqrt(np.asarray(t, dtype=np.float64))
+    x = np.asarray(x, dtype=np.float64)
+    k = np.float64(np.dot(sqrt_t, x) / np.dot(sqrt_t, sqrt_t))
+    return partial(_washburn, k=k), (k,)
 
 
 def fit_washburn_offset(t, x) -> Tuple[Callable, Tuple[np.float64]]:
@@ -66,17 +126,19 @@ def fit_washburn_offset(t, x) -> Tuple[Callable, Tuple[np.float64]]:
         (k, a, b)
             Fitted parameters.
     """
-
-    def func(t, k, a, b):
-        return k * np.sqrt(t - a) + b
-
+    # Start from the Washburn solution without offset, with *a* kept in bounds.
+    a0 = min(0.0, t[0])
+    sqrt_t = np.sqrt(np.asarray(t, dtype=np.float64) - a0)
+    k0 = np.dot(sqrt_t, x) / np.dot(sqrt_t, sqrt_t)
     ret, _ = curve_fit(
-        func,
+        _washburn_offset,
         t,
         x,
+        p0=(k0, a0, 0.0),
         bounds=((-np.inf, -np.inf, -np.inf), (np.inf, t[0], np.inf)),
     )
-    return lambda t: func(t, *ret), ret
+    k, a, b = ret
+    return partial(_washburn_offset, k=k, a=a, b=b), ret
 
 
 def fit_washburn_rideal(t, x) -> Tuple[Callable, Tuple[np.float64, np.float64]]:
@@ -97,7 +159,8 @@ def fit_washburn_rideal(t, x) -> Tuple[Callable, Tuple[np.float64, np.float64]]:
 
     Returns:
         func
-            Washburn-Rideal equation function f(t).
+            Washburn-Rideal equation function f(t). NaN is returned where the
+            equation has no solution.
         (alpha, beta)
             Fitted parameters.
 
@@ -109,21 +172,17 @@ def fit_washburn_rideal(t, x) -> Tuple[Callable, Tuple[np.float64, np.float64]]:
              porous medium. Journal of the Chemical Society, Faraday Transactions 2:
              Molecular and Chemical Physics, 71, 12-21.
     """
-
-    def washburn(t, a, b):
-        return np.sqrt(2 * b / a * t)
-
-    def washburn_rideal(x, a, b):
-        return np.piecewise(
-            x,
-            [x > 0, x == 0],
-            [lambda x: a / 2 / b * x**2 - 1 / a * np.log(x), 0],
-        )
-
-    ret, _ = curve_fit(washburn_rideal, x, t)
-
-    def func(t):
-        t = np.array(t)
-        return root(lambda x: washburn_rideal(x, *ret) - t, washburn(t, *ret)).x
-
-    return func, ret
+    # t is linear in alpha/(2 beta) and -1/alpha, so the linear least squares
+    # solution is used as initial guess if it gives positive parameters.
+    t = np.asarray(t, dtype=np.float64)
+    x = np.asarray(x, dtype=np.float64)
+    mask = x > 0
+    A = np.column_stack([x[mask] ** 2, np.log(x[mask])])
+    (u, w), *_ = np.linalg.lstsq(A, t[mask], rcond=None)
+    if u > 0 and w < 0:
+        p0 = (-1 / w, -1 / w / 2 / u)
+    else:
+        p0 = None
+    ret, _ = curve_fit(_washburn_rideal, x, t, p0=p0, jac=_washburn_rideal_jac)
+    a, b = ret
+    return partial(_washburn_rideal_inverse, a=a, b=b), ret
@@ -0,0 +1,331 @@
+"""Unidirectional wetting front analysis."""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from queue import Queue
+from threading import Thread
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from . import _load_entry_point
+
+__all__ = [
+    "unidirect_analyzer",
+]
+
+# RGB colors of the detected and the fitted wetting fronts drawn on the output video.
+_RED = np.array([255, 0, 0], dtype=np.uint8)
+_BLUE = np.array([0, 0, 255], dtype=np.uint8)
+
+
+def _luma(frame) -> np.ndarray:
+    """Get the luma of :class:`av.VideoFrame` as uint8 array with shape (H, W).
+
+    For 8-bit YUV formats whose first plane holds only the luma (e.g., yuv420p and
+    nv12), the plane is returned as a view without conversion or copy. Other formats are
+    converted to grayscale.
+    """
+    components = frame.format.components
+    if (
+        components[0].is_luma
+        and components[0].bits == 8
+        and sum(c.plane == 0 for c in components) == 1
+    ):
+        plane = frame.planes[0]
+        buf = np.frombuffer(plane, dtype=np.uint8)
+        return buf.reshape(plane.height, plane.line_size)[:, : plane.width]
+    return frame.to_ndarray(format="gray")
+
+
+def _rgb(frame) -> np.ndarray:
+    """Get :class:`av.VideoFrame` as writable uint8 array with shape (H, W, 3).
+
+    The frame is converted to rgb24 by PyAV and the plane of the converted frame is
+    returned as a view, instead of being copied to a new array.
+    """
+    plane = frame.reformat(format="rgb24").planes[0]
+    buf = np.frombuffer(plane, dtype=np.uint8)
+    rows = buf.reshape(plane.height, plane.line_size)[:, : plane.width * 3]
+    return rows.reshape(plane.height, plane.width, 3)
+
+
+def _front_row(
+    gray: np.ndarray,
+    rows: Optional[np.ndarray] = None,
+    diff: Optional[np.ndarray] = None,
+) -> int:
+    """Find the row index of the wetting front in grayscale image.
+
+    The front is where the row-summed intensity changes the most between adjacent
+    rows.
+
+    Arguments:
+        gray: Grayscale image with shape (H, W).
+        rows: Optional int32 buffer with shape (H,) to store the row sums.
+        diff: Optional int32 buffer with shape (H - 1,) to store the row
+            differences.
+
+    Pass the same buffers for consecutive frames to avoid reallocation. The sums
+    of uint8 rows fit in int32 for any practical image width.
+    """
+    row_sum = gray.sum(axis=1, dtype=np.int32, out=rows)
+    row_diff = np.subtract(row_sum[1:], row_sum[:-1], out=diff)
+    np.abs(row_diff, out=row_diff)
+    return int(row_diff.argmax())
+
+
+def _fronts(container, stream, start=None, stop=None):
+    """Decode video stream and yield the frames with the rows of wetting fronts.
+
+    Only the frames whose presentation timestamps are in [*start*, *stop*) are yielded.
+    If *start* is passed, it must be the timestamp of a keyframe so that decoding can
+    begin there.
+    """
+    rows = np.empty(stream.height, dtype=np.int32)
+    diff = np.empty(stream.height - 1, dtype=np.int32)
+    if start is not None:
+        container.seek(start, stream=stream)
+    for frame in container.decode(stream):
+        pts = frame.pts
+        if pts is not None and start is not None and pts < start:
+            continue
+        if pts is not None and stop is not None and pts >= stop:
+            break
+        yield frame, _front_row(_luma(frame), rows, diff)
+
+
+def _heights(fronts, capacity: int) -> np.ndarray:
+    """Collect wetting heights from :func:`_fronts` into int32 array.
+
+    The array is allocated for *capacity* frames and is grown if it is exceeded.
+    """
+    heights = np.empty(capacity or 1024, dtype=np.int32)
+    n = 0
+    for frame, row in fronts:
+        if n == len(heights):
+            heights = np.resize(heights, 2 * n)
+        heights[n] = frame.height - row
+        n += 1
+    return heights[:n]
+
+
+def _unidirect_heights(
+    path: str, start: Optional[int] = None, stop: Optional[int] = None
+) -> np.ndarray:
+    """Detect wetting heights from the frames of video file.
+
+    See :func:`_fronts` for *start* and *stop*.
+    """
+    import av
+
+    with av.open(path) as container:
+        stream = container.streams.video[0]
+        return _heights(_fronts(container, stream, start, stop), stream.frames)
+
+
+def _gop_ranges(
+    keyframes: List[int], n: int
+) -> List[Tuple[Optional[int], Optional[int]]]:
+    """Split the video into at most *n* timestamp ranges starting at keyframes."""
+    cuts = sorted(keyframes)[1:]
+    size = math.ceil((len(cuts) + 1) / n)
+    bounds: List[Optional[int]] = [None, *cuts[size - 1 :: size], None]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _cpu_count() -> int:
+    """Get the number of CPUs available to the current process."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _video_heights(path: str, workers: int) -> Tuple[np.ndarray, float]:
+    """Detect wetting heights from the frames of video file with its frame rate.
+
+    Each GOP can be decoded independently, so the video is split at keyframes and
+    analyzed in at most *workers* parallel processes.
+    """
+    import av
+
+    with av.open(path) as container:
+        stream = container.streams.video[0]
+        fps = float(stream.guessed_rate)  # type: ignore[arg-type]
+        keyframes = []
+        if workers > 1:
+            for packet in container.demux(stream):
+                if packet.is_keyframe and packet.pts is not None:
+                    keyframes.append(packet.pts)
+    ranges = _gop_ranges(keyframes, workers)
+    if len(ranges) > 1:
+        with ProcessPoolExecutor(len(ranges)) as executor:
+            futures = [
+                executor.submit(_unidirect_heights, path, start, stop)
+                for start, stop in ranges
+            ]
+            heights = np.concatenate([future.result() for future in futures])
+    else:
+        heights = _unidirect_heights(path)
+    return heights, fps
+
+
+def unidirect_analyzer(k, v):
+    """Image analysis for unidirectional liquid imbibition in porous medium.
+
+    .. note::
+
+        To evoke this analyzer, you need ``img`` optional dependency::
+
+            pip install wettingfront[img]
+
+    Unidirectional analyzer detects the horizontal wetting front in the image by
+    pixel intensities and fits the data to model.
+
+    The analyzer defines the following fields in configuration entry:
+
+    - **model** (`str`, optional): Wetting front model, implemented by plugins.
+    - **path** (`str`): Path to the input video file.
+    - **output-vid** (`str`, optional): Path to the output video file.
+    - **output-data** (`str`, optional): Path to the output csv file.
+    - **workers** (`int`, optional): Maximum number of processes to detect the
+      wetting heights. Defaults to the number of CPUs available to the current
+      process. Set to 1 to analyze in the current process only.
+
+    The output csv file contains three colums; time, wetting height, and fitted
+    wetting height. The time unit is seconds and the distance unit is pixels.
+    The output video shows the detected wetting front in red and the fitted wetting
+    front in blue.
+
+    If multiple workers are allowed and the video has multiple keyframes, the video
+    is split at the keyframes and analyzed by
+    :class:`concurrent.futures.ProcessPoolExecutor`. With the ``spawn`` start
+    method (default on Windows and macOS), a script calling this analyzer must
+    therefore guard its entry point by ``if __name__ == "__main__":``.
+
+    The following is the example for an entry in YAML configuration file:
+
+    .. code-block:: yaml
+
+        foo:
+            type: Unidirectional
+            model: Washburn
+            path: foo.mp4
+            output-vid: output/foo.mp4
+            output-data: output/foo.csv
+    """
+    import av
+    import imageio.v3 as iio
+
+    # Prepare output
+    model_name = v.get("model")
+    if model_name is not None:
+        model = _load_entry_point("wettingfront.models", model_name)
+        if model is None:
+            raise KeyError(model_name)
+    else:
+        model = None
+    path = os.path.expandvars(v["path"])
+    workers = v.get("workers")
+    if workers is None:
+        workers = _cpu_count()
+    elif workers < 1:
+        raise ValueError(f"Invalid number of workers: {workers}")
+    out_vid = v.get("output-vid")
+    out_data = v.get("output-data")
+    if out_vid:
+        out_vid = os.path.expandvars(v["output-vid"])
+        dirname, _ = os.path.split(out_vid)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+    if out_data:
+        out_data = os.path.expandvars(v["output-data"])
+        dirname, _ = os.path.split(out_data)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+    if not (out_vid or out_data):
+        return
+
+    # The heights are detected and fitted first so that the fitted wetting front
+    # can be drawn on the video, which is encoded only if requested.
+    heights, fps = _video_heights(path, workers)
+    times = np.arange(len(heights)) / fps
+    if model is not None:
+        func, _ = model(times, heights)
+        fitted = func(times)
+    else:
+        fitted = None
+
+    def iioWriter(path, codec, fps, queue, errors):
+        # Runs in a separate thread; PyAV releases the GIL while converting and
+        # encoding, so this overlaps with decoding.
+        try:
+            with iio.imopen(path, "w", plugin="pyav") as out:
+                out.init_video_stream(codec, fps=fps)
+                red_row = blue_row = None
+                while True:
+                    item = queue.get()
+                    if item is None:
+                        break
+                    frame, h, fit_h = item
+                    img = _rgb(frame)
+                    if red_row is None:
+                        red_row = np.tile(_RED, (img.shape[1], 1))
+                        blue_row = np.tile(_BLUE, (img.shape[1], 1))
+                    if fit_h >= 0:
+                        img[fit_h] = blue_row
+                    img[h] = red_row
+                    out.write_frame(img)
+        except Exception as err:
+            errors.append(err)
+            # Keep consuming so that the producer is never blocked.
+            while queue.get() is not None:
+                pass
+
+    if out_vid:
+        with av.open(path) as container:
+            stream = container.streams.video[0]
+            height = stream.height
+            rows = height - heights
+            if fitted is not None:
+                fit_rows = height - np.rint(fitted)
+                valid = np.isfinite(fit_rows) & (fit_rows >= 0) & (fit_rows < height)
+                fit_rows = np.where(valid, fit_rows, -1).astype(np.int64)
+            else:
+                fit_rows = np.full(len(rows), -1)
+
+            frames: Queue = Queue(maxsize=8)
+            errors: List[Exception] = []
+            writer = Thread(
+                target=iioWriter,
+                args=(out_vid, stream.codec.name, fps, frames, errors),
+            )
+            writer.start()
+            try:
+                for frame, h, fit_h in zip(container.decode(stream), rows, fit_rows):
+                    frames.put((frame, h, fit_h))
+            finally:
+                frames.put(None)
+                writer.join()
+            if errors:
+                raise errors[0]
+
+    # write data
+    if out_data:
+        header = ["time (s)", "height (pixels)"]
+        columns = [times, heights]
+        fmt = ["%.6f", "%d"]
+        if fitted is not None:
+            header.append("fitted height (pixels)")
+            columns.append(fitted)
+            fmt.append("%.6f")
+        np.savetxt(
+            out_data,
+            np.column_stack(columns),
+            fmt=fmt,
+            delimiter=",",
+            header=",".join(header),
+            comments="",
+        )
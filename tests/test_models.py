@@ -0,0 +1,66 @@
+import numpy as np
+
+from wettingfront.models import (
+    _washburn_rideal,
+    _washburn_rideal_inverse,
+    _washburn_rideal_jac,
+    fit_washburn,
+    fit_washburn_offset,
+    fit_washburn_rideal,
+)
+
+
+def test_fit_washburn():
+    t = np.linspace(0, 10, 100)
+    x = 3 * np.sqrt(t)
+    func, (k,) = fit_washburn(t, x)
+    assert np.isclose(k, 3)
+    assert np.allclose(func(t), x)
+
+
+def test_fit_washburn_offset():
+    # Fitting starts from a = t[0], on the bound.
+    t = np.linspace(0, 10, 100)
+    x = 2 * np.sqrt(t + 1) + 0.5
+    func, params = fit_washburn_offset(t, x)
+    assert np.allclose(params, (2, -1, 0.5))
+    assert np.allclose(func(t), x)
+
+    t = np.linspace(1, 10, 100)
+    x = 2 * np.sqrt(t - 0.5) + 0.5
+    func, params = fit_washburn_offset(t, x)
+    assert np.allclose(params, (2, 0.5, 0.5))
+    assert np.allclose(func(t), x)
+
+
+def test_fit_washburn_rideal():
+    a, b = 0.5, 2.0
+    x = np.linspace(np.sqrt(b) / a, 30, 200)
+    t = _washburn_rideal(x, a, b)
+    func, params = fit_washburn_rideal(t, x)
+    assert np.allclose(params, (a, b))
+    assert np.allclose(func(t), x)
+
+    noisy_x = x + np.random.default_rng(0).normal(0, 0.01, x.shape)
+    _, params = fit_washburn_rideal(t, noisy_x)
+    assert np.allclose(params, (a, b), rtol=1e-2)
+
+
+def test_washburn_rideal_jac():
+    a, b, eps = 0.5, 2.0, 1e-6
+    x = np.array([-1.0, 0.0, 0.05, 1.0, 10.0])
+    jac = _washburn_rideal_jac(x, a, b)
+    da = (_washburn_rideal(x, a + eps, b) - _washburn_rideal(x, a - eps, b)) / 2 / eps
+    db = (_washburn_rideal(x, a, b + eps) - _washburn_rideal(x, a, b - eps)) / 2 / eps
+    assert np.allclose(jac, np.column_stack([da, db]))
+
+
+def test_washburn_rideal_inverse():
+    a, b = 0.5, 2.0
+    t = _washburn_rideal(np.linspace(0.05, 30, 200), a, b)
+    x = _washburn_rideal_inverse(t, a, b)
+    assert not np.any(np.isnan(x))
+    assert np.allclose(_washburn_rideal(x, a, b), t, atol=1e-8)
+    # No root exists below the minimum at sqrt(b)/a.
+    t_min = _washburn_rideal(np.sqrt(b) / a, a, b)
+    assert np.all(np.isnan(_washburn_rideal_inverse([t_min - 0.1, -10], a, b)))
@@ -1,9 +1,12 @@
 import os
 import subprocess
 
+import av
+import numpy as np
 import yaml
 
 from wettingfront import get_sample_path
+from wettingfront.unidirect import _gop_ranges, _unidirect_heights
 
 
 def test_Unidirectional(tmp_path):
@@ -37,3 +40,69 @@ def test_Unidirectional(tmp_path):
     assert os.path.exists(config["data1"]["output-data"])
     assert os.path.exists(config["data2"]["output-vid"])
     assert os.path.exists(config["data2"]["output-data"])
+
+
+def test_gop_ranges():
+    assert _gop_ranges([], 4) == [(None, None)]
+    assert _gop_ranges([0], 4) == [(None, None)]
+    keyframes = [40, 0, 20, 10, 30]
+    assert _gop_ranges(keyframes, 1) == [(None, None)]
+    assert _gop_ranges(keyframes, 2) == [(None, 30), (30, None)]
+    assert _gop_ranges(keyframes, 3) == [(None, 20), (20, 40), (40, None)]
+    assert _gop_ranges(keyframes, 10) == [
+        (None, 10),
+        (10, 20),
+        (20, 30),
+        (30, 40),
+        (40, None),
+    ]
+
+
+def test_unidirect_heights_gop():
+    path = get_sample_path("example.mp4")
+    with av.open(path) as container:
+        stream = container.streams.video[0]
+        keyframes = [
+            packet.pts
+            for packet in container.demux(stream)
+            if packet.is_keyframe and packet.pts is not None
+        ]
+    assert len(keyframes) > 1
+    heights = _unidirect_heights(path)
+    for n in range(2, 5):
+        ranges = _gop_ranges(keyframes, n)
+        assert len(ranges) > 1
+        gop_heights = [_unidirect_heights(path, a, b) for a, b in ranges]
+        assert np.array_equal(np.concatenate(gop_heights), heights)
+
+
+def test_Unidirectional_workers(tmp_path):
+    config = dict(
+        serial={
+            "type": "Unidirectional",
+            "path": get_sample_path("example.mp4"),
+            "output-data": str(tmp_path / "serial.csv"),
+            "workers": 1,
+        },
+        parallel={
+            "type": "Unidirectional",
+            "path": get_sample_path("example.mp4"),
+            "output-data": str(tmp_path / "parallel.csv"),
+            "workers": 2,
+        },
+    )
+    path = tmp_path / "config.yml"
+    with open(path, "w") as f:
+        yaml.dump(config, f)
+    code = subprocess.call(
+        [
+            "wettingfront",
+            "analyze",
+            path,
+        ],
+    )
+    assert not code
+    with open(config["serial"]["output-data"]) as f1, open(
+        config["parallel"]["output-data"]
+    ) as f2:
+        assert f1.read() == f2.read()